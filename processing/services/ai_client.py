@@ -11,6 +11,7 @@ Usage:
 """
 
 import json
+import logging
 
 # TODO: confirm exact AI Gateway FFI API shape once pywrangler docs stabilise
 # The pattern below follows the universal gateway.run() interface from
@@ -19,6 +20,8 @@ import json
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 MAX_RETRIES = 2
 
+logger = logging.getLogger(__name__)
+
 
 class AnthropicClient:
     """Wrapper for Anthropic Claude calls via Cloudflare AI Gateway."""
@@ -71,7 +74,7 @@ class AnthropicClient:
             return str(result)
 
         except Exception as e:
-            print(f"[AI_CLIENT] Anthropic call failed: {e}")
+            logger.error("[AI_CLIENT] Anthropic call failed: %s", e)
             return ""
 
     async def extract_json(self, prompt: str, max_tokens: int = 1024) -> dict | None:
@@ -114,7 +117,7 @@ class AnthropicClient:
         except (ValueError, json.JSONDecodeError):
             pass
 
-        print(f"[AI_CLIENT] Failed to parse JSON from response: {text[:200]}")
+        logger.error("[AI_CLIENT] Failed to parse JSON from response: %s", text[:200])
         return None
 
 
@@ -135,5 +138,5 @@ async def get_embedding(text: str, env) -> list[float] | None:
                 return list(data[0])
         return None
     except Exception as e:
-        print(f"[AI_CLIENT] Embedding generation failed: {e}")
+        logger.error("[AI_CLIENT] Embedding generation failed: %s", e)
         return None
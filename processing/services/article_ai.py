@@ -11,6 +11,7 @@ TS counterpart: ArticleAIService.processArticle() lines 50-123
 """
 
 import hashlib
+import logging
 import time
 
 from services.content_cleaner import clean_html_content
@@ -18,6 +19,8 @@ from services.keyword_extractor import extract_keywords
 from services.quality_scorer import score_quality
 from services.ai_client import get_embedding
 
+logger = logging.getLogger(__name__)
+
 
 async def process_article(article: dict, env=None) -> dict:
     """
@@ -104,7 +107,7 @@ async def process_article(article: dict, env=None) -> dict:
                 #     "metadata": {"title": title, "category": category},
                 # }])
         except Exception as e:
-            print(f"[ARTICLE_AI] Embedding failed for article {article_id}: {e}")
+            logger.error("[ARTICLE_AI] Embedding failed for article %s: %s", article_id, e)
 
     processing_time_ms = int((time.time() - start) * 1000)
 
@@ -11,7 +11,9 @@ semantic understanding, replacing:
 TS counterpart: StoryClusteringService.ts (152 lines)
 """
 
+import logging
 import re
+from collections import Counter, defaultdict
 
 # TODO: confirm numpy availability in Pyodide; fall back to pure Python if needed
 try:
@@ -22,11 +24,13 @@ except ImportError:
 
 from services.ai_client import get_embedding
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # Multilingual stopwords — Pan-African platform, not English-only
 # ---------------------------------------------------------------------------
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     # English
     "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "by", "from", "up", "about", "into", "through", "during",
@@ -53,7 +57,10 @@ STOP_WORDS = {
     # Arabic (North Africa — Egypt, Morocco)
     "في", "من", "إلى", "على", "عن", "مع", "هذا", "هذه", "التي",
     "الذي", "كان", "قال", "بعد",
-}
+})
+
+# Punctuation stripped from titles before splitting into words
+TITLE_PUNCT_RE = re.compile(r"[^\w\s]")
 
 # Limits for DoS prevention (match TS)
 MAX_TITLE_LENGTH = 500
@@ -100,7 +107,7 @@ async def cluster_articles(articles: list[dict], config: dict = None, env=None)
             if result:
                 return {"clusters": result, "method": "semantic"}
         except Exception as e:
-            print(f"[CLUSTERING] Semantic clustering failed, falling back to Jaccard: {e}")
+            logger.warning("[CLUSTERING] Semantic clustering failed, falling back to Jaccard: %s", e)
 
     # Fallback: word-based Jaccard (same logic as TS, but with multilingual stopwords)
     clusters = _jaccard_cluster(articles, threshold=threshold, max_related=max_related, max_clusters=max_clusters)
@@ -144,7 +151,10 @@ def _build_clusters(
     max_related: int,
     max_clusters: int,
 ) -> list[dict]:
-    """Build clusters from a similarity matrix."""
+    """
+    Build clusters from a similarity matrix — a numpy array, or a list of
+    sparse dict rows (see _jaccard_matrix) where missing pairs are 0.0.
+    """
     clusters = []
     assigned: set[int] = set()
 
@@ -159,6 +169,8 @@ def _build_clusters(
             "article_count": 1,
         }
         assigned.add(i)
+        row = similarity_matrix[i]
+        sparse = isinstance(row, dict)
 
         for j in range(i + 1, len(articles)):
             if j in assigned:
@@ -167,7 +179,7 @@ def _build_clusters(
             if articles[i].get("source") == articles[j].get("source"):
                 continue
 
-            sim = float(similarity_matrix[i][j]) if HAS_NUMPY else similarity_matrix[i][j]
+            sim = row.get(j, 0.0) if sparse else float(row[j])
             if sim >= threshold:
                 cluster["related_articles"].append(articles[j])
                 cluster["article_count"] += 1
@@ -195,16 +207,31 @@ def _jaccard_cluster(
     """
     # Pre-compute normalised title words
     title_words = [_normalise_title(a.get("title", "")) for a in articles]
+    sim = _jaccard_matrix(title_words)
+    return _build_clusters(articles, sim, threshold, max_related, max_clusters)
 
-    # Build Jaccard similarity "matrix" as we go (O(n^2) but n is small ≤ 20)
-    n = len(articles)
-    sim = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim[i][j] = _jaccard_similarity(title_words[i], title_words[j])
-            sim[j][i] = sim[i][j]
 
-    return _build_clusters(articles, sim, threshold, max_related, max_clusters)
+def _jaccard_matrix(title_words: list[list[str]]) -> list[dict[int, float]]:
+    """
+    Sparse Jaccard similarity "matrix" — sim[i][j], 0.0 for unrelated titles.
+
+    An inverted index (word -> titles containing it) yields only the pairs
+    that share at least one word, with their intersection sizes, so
+    unrelated pairs are never compared. Exact, unlike MinHash/LSH.
+    """
+    word_sets = [set(words) for words in title_words]
+    postings: dict[str, list[int]] = defaultdict(list)
+    for i, words in enumerate(word_sets):
+        for word in words:
+            postings[word].append(i)
+
+    sim: list[dict[int, float]] = [{} for _ in word_sets]
+    for i, words in enumerate(word_sets):
+        shared = Counter(j for word in words for j in postings[word] if j > i)
+        for j, intersection in shared.items():
+            union = len(words) + len(word_sets[j]) - intersection
+            sim[i][j] = sim[j][i] = intersection / union
+    return sim
 
 
 def _normalise_title(title: str) -> list[str]:
@@ -215,8 +242,9 @@ def _normalise_title(title: str) -> list[str]:
     if not title or not isinstance(title, str):
         return []
     title = title[:MAX_TITLE_LENGTH]
-    words = re.sub(r"[^\w\s]", "", title.lower()).split()
-    return [w for w in words if len(w) > 3 and w not in STOP_WORDS][:MAX_WORDS]
+    words = TITLE_PUNCT_RE.sub("", title.lower()).split()
+    stop_words = STOP_WORDS  # local lookup inside the comprehension
+    return [w for w in words if len(w) > 3 and w not in stop_words][:MAX_WORDS]
 
 
 def _jaccard_similarity(words1: list[str], words2: list[str]) -> float:
@@ -10,6 +10,7 @@ TS counterpart: PersonalizedFeedService.ts lines 286-380
 """
 
 import math
+from datetime import datetime, timezone
 
 # TODO: confirm numpy availability in Pyodide
 try:
@@ -34,6 +35,12 @@ WEIGHTS = {
 # Recency decay half-life in hours (same as TS)
 RECENCY_HALF_LIFE_HOURS = 24
 
+# Recency score for articles with a missing or unparseable date
+UNKNOWN_RECENCY_SCORE = 0.3
+
+# Engagement mix: views + likes*3 + bookmarks*2 (same as TS)
+ENGAGEMENT_FIELD_WEIGHTS = (("view_count", 1), ("like_count", 3), ("bookmark_count", 2))
+
 
 async def rank_feed(articles: list[dict], preferences: dict) -> dict:
     """
@@ -116,11 +123,23 @@ def _rank_numpy(articles: list[dict], prefs: dict) -> list[dict]:
         for a in articles
     ])
 
-    # Recency: exponential decay with 24-hour half-life
-    recency = np.array([_recency_score(a.get("published_at", "")) for a in articles])
+    # Recency: exponential decay with 24-hour half-life. Dates are parsed
+    # per article against one shared "now"; the decay runs in numpy.
+    now = datetime.now(timezone.utc)
+    hours_old = np.array([_hours_old(a.get("published_at", ""), now) for a in articles], dtype=float)
+    recency = np.where(
+        np.isnan(hours_old),
+        UNKNOWN_RECENCY_SCORE,
+        np.exp(-hours_old * math.log(2) / RECENCY_HALF_LIFE_HOURS),
+    )
 
     # Engagement: logarithmic to prevent viral bias (same formula as TS)
-    engagement = np.array([_engagement_score(a) for a in articles])
+    counts = np.array([
+        [a.get(field, 0) or 0 for field, _ in ENGAGEMENT_FIELD_WEIGHTS]
+        for a in articles
+    ], dtype=float)
+    raw = counts @ np.array([w for _, w in ENGAGEMENT_FIELD_WEIGHTS], dtype=float) + 1
+    engagement = np.log10(np.maximum(raw, 1)) / 3
 
     # Weighted sum
     scores = (
@@ -231,18 +250,22 @@ def _recency_score(published_at: str) -> float:
     Exponential decay based on article age.
     Half-life of 24 hours: article from 24h ago scores 0.5.
     """
-    if not published_at:
-        return 0.3  # Unknown date gets low-ish score
+    hours_old = _hours_old(published_at, datetime.now(timezone.utc))
+    if hours_old is None:
+        return UNKNOWN_RECENCY_SCORE  # Unknown date gets low-ish score
+    return math.exp(-hours_old * math.log(2) / RECENCY_HALF_LIFE_HOURS)
+
 
+def _hours_old(published_at: str, now: datetime) -> float | None:
+    """Article age in hours, or None if the date is missing or unparseable."""
+    if not published_at:
+        return None
     try:
-        from datetime import datetime, timezone
         # Parse ISO date string
         pub = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-        now = datetime.now(timezone.utc)
-        hours_old = (now - pub).total_seconds() / 3600
-        return math.exp(-hours_old * math.log(2) / RECENCY_HALF_LIFE_HOURS)
+        return (now - pub).total_seconds() / 3600
     except (ValueError, TypeError):
-        return 0.3
+        return None
 
 
 def _engagement_score(article: dict) -> float:
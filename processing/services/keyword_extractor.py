@@ -8,8 +8,28 @@ valid JSON than Llama-3-8b, so the fallback paths are simpler.
 TS counterpart: ArticleAIService.extractKeywords() lines 249-345
 """
 
+import asyncio
+import logging
+import time
+from functools import lru_cache
+
 from services.ai_client import AnthropicClient
 
+logger = logging.getLogger(__name__)
+
+# Max article characters sent to Claude (matches TS content.substring(0, 1500))
+PROMPT_CONTENT_CHARS = 1500
+
+# Edge cache keywords change slowly — reuse them across a burst of articles
+KEYWORD_CACHE_TTL_SECONDS = 300
+
+# Batch endpoint limits — cap request size and concurrent Claude calls
+MAX_BATCH_ARTICLES = 50
+BATCH_CONCURRENCY = 5
+
+_keyword_cache: tuple[float, list[dict]] | None = None
+_keyword_inflight: asyncio.Future | None = None
+
 
 async def extract_keywords(
     title: str,
@@ -42,25 +62,55 @@ async def extract_keywords(
     # TODO: migrate to MongoDB as primary source once MongoDBClient
     # is wired in — D1 is the edge cache, not primary data store
     # ---------------------------------------------------------------
-    keyword_list = ""
-    db_keywords: list[dict] = []
-
-    if env:
-        try:
-            result = await env.EDGE_CACHE_DB.prepare("""
-                SELECT k.keyword, k.category_id, k.relevance_score
-                FROM keywords k
-                JOIN categories c ON k.category_id = c.id
-                WHERE c.enabled = 1
-                ORDER BY k.usage_count DESC, k.relevance_score DESC
-                LIMIT 50
-            """).all()
-
-            if result and hasattr(result, "results"):
-                db_keywords = list(result.results)
-                keyword_list = ", ".join(k["keyword"] for k in db_keywords)
-        except Exception as e:
-            print(f"[KEYWORDS] Failed to load edge cache keywords: {e}")
+    db_keywords = await _load_keywords(env) if env else []
+    return await _extract_with_keywords(title, content, db_keywords, env)
+
+
+async def extract_keywords_batch(articles: list[dict], env=None) -> dict:
+    """
+    Extract keywords for several articles in one call.
+
+    Loads the keyword list once and runs the per-article Claude calls
+    concurrently (bounded by BATCH_CONCURRENCY).
+
+    Args:
+        articles: List of {"title": str, "content": str, "category": str | None}
+        env: Cloudflare env bindings (for EDGE_CACHE_DB + AI)
+
+    Returns:
+        {"results": [{"keywords": [...]}, ...]}  # same order as input
+        or {"results": [], "error": str} if more than MAX_BATCH_ARTICLES are sent
+    """
+    if len(articles) > MAX_BATCH_ARTICLES:
+        return {
+            "results": [],
+            "error": f"Batch too large: {len(articles)} articles (max {MAX_BATCH_ARTICLES})",
+        }
+    if not articles:
+        return {"results": []}
+
+    db_keywords = await _load_keywords(env) if env else []
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def _one(article: dict) -> dict:
+        content = article.get("content", "")
+        if not content or len(content) < 50:
+            return {"keywords": []}
+        async with semaphore:
+            return await _extract_with_keywords(article.get("title", ""), content, db_keywords, env)
+
+    results = await asyncio.gather(*[_one(a) for a in articles])
+    return {"results": list(results)}
+
+
+async def _extract_with_keywords(
+    title: str,
+    content: str,
+    db_keywords: list[dict],
+    env,
+) -> dict:
+    """Run Claude extraction (with text-matching fallback) against a loaded keyword list."""
+    keyword_list = ", ".join(k["keyword"] for k in db_keywords)
 
     # ---------------------------------------------------------------
     # AI extraction via Anthropic Claude
@@ -69,31 +119,23 @@ async def extract_keywords(
 
     if env and keyword_list:
         client = AnthropicClient(env)
-        prompt = f"""Analyze this news article and extract relevant keywords.
-
-Article Title: {title}
-Article Content: {content[:1500]}
-
-Available Keywords: {keyword_list}
-
-Instructions:
-1. Identify the most relevant keywords from the available list that match this article
-2. Consider Pan-African context (Zimbabwe politics, regional business, sports, etc.)
-3. Return max 8 keywords
-4. Rate confidence 0.0-1.0 for each keyword
-
-Return JSON only, no explanation:
-{{"keywords": [{{"keyword": "example", "confidence": 0.9}}]}}"""
+        prompt = "".join([
+            "Analyze this news article and extract relevant keywords.\n\n",
+            "Article Title: ", title, "\n",
+            "Article Content: ", _truncate_on_word(content, PROMPT_CONTENT_CHARS), "\n\n",
+            _prompt_instructions(keyword_list),
+        ])
 
         parsed = await client.extract_json(prompt, max_tokens=500)
 
         if parsed and "keywords" in parsed and isinstance(parsed["keywords"], list):
+            keyword_index = _index_keywords(db_keywords)
             for kw in parsed["keywords"]:
                 keyword_text = kw.get("keyword", "")
                 confidence = kw.get("confidence", 0.0)
 
                 # Match against DB keywords to get category
-                db_match = _find_db_keyword(keyword_text, db_keywords)
+                db_match = keyword_index.get(keyword_text.lower())
                 if db_match and confidence > 0.5:
                     extracted.append({
                         "keyword": keyword_text,
@@ -119,10 +161,89 @@ Return JSON only, no explanation:
     return {"keywords": extracted[:8]}
 
 
-def _find_db_keyword(keyword: str, db_keywords: list[dict]) -> dict | None:
-    """Find a matching keyword in the database list (case-insensitive)."""
-    keyword_lower = keyword.lower()
+async def _load_keywords(env) -> list[dict]:
+    """
+    Load keywords from the D1 edge cache, shared across concurrent callers.
+
+    A fresh cached list is returned directly; otherwise the first caller
+    runs the query and everyone arriving while it is in flight awaits the
+    same future, so a burst of articles costs a single D1 round trip.
+    """
+    global _keyword_cache, _keyword_inflight
+
+    if _keyword_cache and time.monotonic() - _keyword_cache[0] < KEYWORD_CACHE_TTL_SECONDS:
+        return _keyword_cache[1]
+
+    if _keyword_inflight is not None:
+        return await asyncio.shield(_keyword_inflight)
+
+    future = asyncio.get_running_loop().create_future()
+    _keyword_inflight = future
+    try:
+        keywords = await _query_keywords(env)
+        if keywords:
+            _keyword_cache = (time.monotonic(), keywords)
+        future.set_result(keywords)
+        return keywords
+    finally:
+        if not future.done():
+            future.set_result([])
+        _keyword_inflight = None
+
+
+async def _query_keywords(env) -> list[dict]:
+    """Query enabled-category keywords from the D1 edge cache."""
+    try:
+        result = await env.EDGE_CACHE_DB.prepare("""
+            SELECT k.keyword, k.category_id, k.relevance_score
+            FROM keywords k
+            JOIN categories c ON k.category_id = c.id
+            WHERE c.enabled = 1
+            ORDER BY k.usage_count DESC, k.relevance_score DESC
+            LIMIT 50
+        """).all()
+
+        if result and hasattr(result, "results"):
+            return list(result.results)
+    except Exception as e:
+        logger.error("[KEYWORDS] Failed to load edge cache keywords: %s", e)
+    return []
+
+
+def _index_keywords(db_keywords: list[dict]) -> dict[str, dict]:
+    """
+    Map lowercased keyword -> DB keyword (first occurrence wins).
+    Built once per article so matching Claude's picks is a dict lookup
+    instead of a case-insensitive scan of the whole list per keyword.
+    """
+    index: dict[str, dict] = {}
     for db_kw in db_keywords:
-        if db_kw["keyword"].lower() == keyword_lower:
-            return db_kw
-    return None
+        index.setdefault(db_kw["keyword"].lower(), db_kw)
+    return index
+
+
+def _truncate_on_word(text: str, limit: int) -> str:
+    """Cut text to at most `limit` chars, preferring the last word boundary."""
+    if len(text) <= limit:
+        return text
+    end = text.rfind(" ", 0, limit)
+    # Only back off to the boundary if it doesn't throw away too much text
+    return text[:end] if end > limit * 2 // 3 else text[:limit]
+
+
+@lru_cache(maxsize=4)
+def _prompt_instructions(keyword_list: str) -> str:
+    """
+    Static tail of the extraction prompt.
+    Cached per keyword list — it only changes when the edge cache keywords do.
+    """
+    return f"""Available Keywords: {keyword_list}
+
+Instructions:
+1. Identify the most relevant keywords from the available list that match this article
+2. Consider Pan-African context (Zimbabwe politics, regional business, sports, etc.)
+3. Return max 8 keywords
+4. Rate confidence 0.0-1.0 for each keyword
+
+Return JSON only, no explanation:
+{{"keywords": [{{"keyword": "example", "confidence": 0.9}}]}}"""
@@ -15,7 +15,7 @@ Env bindings required:
   - MONGODB_DATABASE     : Database name (e.g. "mukoko_news")
 
 Usage:
-    db = MongoDBClient(env)
+    db = get_client(env)
     articles = await db.find("articles", {"category": "news"}, limit=20)
     article = await db.find_one("articles", {"_id": article_id})
     result = await db.insert_one("articles", {"title": "...", ...})
@@ -25,11 +25,29 @@ Atlas Data API docs: https://www.mongodb.com/docs/atlas/app-services/data-api/
 """
 
 import json
+import logging
 
 # TODO: use httpx (async, supported in Python Workers) once confirmed;
 # for now, use the JS fetch via FFI as the transport layer
 # import httpx
 
+logger = logging.getLogger(__name__)
+
+# Last client handed out by get_client() — reused while the env is unchanged
+_client = None
+
+
+def get_client(env) -> "MongoDBClient":
+    """
+    Return a MongoDBClient for `env`, reusing the existing one when the
+    env bindings are the same object (i.e. within a request, and across
+    requests served by the same isolate).
+    """
+    global _client
+    if _client is None or _client.env is not env:
+        _client = MongoDBClient(env)
+    return _client
+
 
 class MongoDBClient:
     """HTTP client for MongoDB Atlas Data API."""
@@ -238,16 +256,17 @@ class MongoDBClient:
 
             if not response.ok:
                 text = await response.text()
-                print(f"[MONGODB] {action} failed ({response.status}): {text[:200]}")
+                logger.error("[MONGODB] %s failed (%s): %s", action, response.status, text[:200])
                 return {}
 
-            text = await response.text()
-            return json.loads(text) if text else {}
+            # Success path: let JS parse the body (one await, no Python json.loads)
+            data = await response.json()
+            return data.to_py() if hasattr(data, "to_py") else (data or {})
 
         except ImportError:
             # Not running in Workers — fallback for local testing
-            print(f"[MONGODB] JS FFI not available, cannot make request to {action}")
+            logger.warning("[MONGODB] JS FFI not available, cannot make request to %s", action)
             return {}
         except Exception as e:
-            print(f"[MONGODB] Request failed: {e}")
+            logger.error("[MONGODB] Request failed: %s", e)
             return {}
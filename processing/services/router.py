@@ -8,15 +8,22 @@ We parse the path and dispatch to the right service.
 """
 
 import json
+import logging
+from urllib.parse import urlsplit
 from workers import Response
 
+logger = logging.getLogger(__name__)
+
+_logging_configured = False
+
 
 async def handle_request(request, env):
     """Route incoming Service Binding requests to the appropriate service."""
+    _configure_logging(env)
 
     url = request.url
     # Extract path from full URL (e.g. "http://processing/rss/parse" -> "/rss/parse")
-    path = "/" + url.split("/", 3)[-1] if "/" in url else "/"
+    path = urlsplit(url).path or "/"
     method = request.method
 
     try:
@@ -39,6 +46,15 @@ async def handle_request(request, env):
             )
             return _json(result)
 
+        if path == "/rss/parse_batch" and method == "POST":
+            from services.rss_parser import parse_rss_feeds
+            body = await _body(request)
+            result = await parse_rss_feeds(
+                feeds=body.get("feeds", []),
+                env=env,
+            )
+            return _json(result, status=400 if "error" in result else 200)
+
         # ---------------------------------------------------------------
         # Content cleaning
         # ---------------------------------------------------------------
@@ -74,6 +90,15 @@ async def handle_request(request, env):
             )
             return _json(result)
 
+        if path == "/keywords/extract_batch" and method == "POST":
+            from services.keyword_extractor import extract_keywords_batch
+            body = await _body(request)
+            result = await extract_keywords_batch(
+                articles=body.get("articles", []),
+                env=env,
+            )
+            return _json(result, status=400 if "error" in result else 200)
+
         # ---------------------------------------------------------------
         # Quality scoring
         # ---------------------------------------------------------------
@@ -147,16 +172,29 @@ async def handle_request(request, env):
         return _json({"error": "Not found", "path": path}, status=404)
 
     except Exception as e:
-        print(f"[NEWS-API] Error handling {method} {path}: {e}")
+        logger.error("[NEWS-API] Error handling %s %s: %s", method, path, e)
         return _json({"error": str(e)}, status=500)
 
 
+def _configure_logging(env) -> None:
+    """Apply LOG_LEVEL from wrangler vars ("debug", "info", ...) once per isolate."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    level = logging.getLevelName(str(getattr(env, "LOG_LEVEL", "info")).upper())
+    logging.basicConfig(
+        level=level if isinstance(level, int) else logging.INFO,
+        format="%(levelname)s %(message)s",
+    )
+    _logging_configured = True
+
+
 async def _body(request) -> dict:
     """Parse JSON body from request."""
     try:
         text = await request.text()
         return json.loads(text) if text else {}
-    except (json.JSONDecodeError, Exception):
+    except Exception:
         return {}
 
 
@@ -1,8 +1,8 @@
 """
 RSS feed parser — replaces backend/services/SimpleRSSService.ts parsing logic.
 
-Uses feedparser (handles RSS 2.0, Atom, RDF, CDF) and beautifulsoup4
-for HTML cleaning, replacing:
+Uses feedparser (handles RSS 2.0, Atom, RDF, CDF) and lxml for HTML
+cleaning (beautifulsoup4 when lxml is unavailable), replacing:
   - fast-xml-parser + custom RSS/Atom detection
   - 8 regex patterns for image extraction
   - 3-pass loop-based HTML tag removal
@@ -11,10 +11,30 @@ for HTML cleaning, replacing:
 TS counterpart: SimpleRSSService.parseItem() + extractImage()
 """
 
+import hashlib
+import html as html_lib
 import re
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlsplit
+
 import feedparser
 from bs4 import BeautifulSoup
 
+# lxml strips summary HTML in libxml2 (C) instead of bs4's pure-Python
+# html.parser; fall back to bs4 if it isn't available
+try:
+    import lxml.etree as etree
+    import lxml.html as lxml_html
+    HAS_LXML = True
+    # Compiled once so the per-item <img> lookup skips XPath parsing
+    IMG_SRC_XPATH = etree.XPath(".//img[@src]/@src")
+    # One shared parser; comments and blank text nodes are never read
+    HTML_PARSER = lxml_html.HTMLParser(remove_comments=True, remove_blank_text=True)
+except ImportError:
+    HAS_LXML = False
+
 
 # Common ad/tracking domains to filter — same list as SimpleRSSService.ts
 AD_DOMAINS = frozenset([
@@ -25,9 +45,43 @@ AD_DOMAINS = frozenset([
     "bidswitch.net", "sharethis.com", "addthis.com",
 ])
 
+# Ad hosts matched on the URL's hostname (any subdomain); the few entries
+# with a path (e.g. "facebook.com/tr") are matched on host + path prefix
+AD_HOSTS = frozenset(d for d in AD_DOMAINS if "/" not in d)
+AD_HOST_PATHS = tuple(
+    (host, "/" + path) for host, _, path in (d.partition("/") for d in AD_DOMAINS if "/" in d)
+)
+
+# Items kept per feed — most recent first (matches TS)
+MAX_FEED_ITEMS = 20
+
+# Max feeds accepted by parse_rss_feeds in one call
+MAX_BATCH_FEEDS = 50
+
+# Parsed feeds kept per isolate, keyed by a hash of (feed body, source).
+# Polling often re-downloads unchanged feeds; kept small since full-content
+# feeds can carry tens of KB per article.
+FEED_CACHE_SIZE = 32
+_feed_cache: OrderedDict[bytes, dict] = OrderedDict()
+
 # Image file extensions recognised as valid
 IMAGE_EXT_RE = re.compile(r"\.(jpe?g|png|gif|webp|svg|bmp|avif)(\?.*)?$", re.IGNORECASE)
 
+# Marks "summary not parsed yet" for _extract_image (None means "no <img>")
+_UNPARSED = object()
+
+# Slug normalisation — compiled once, used for every feed item
+SLUG_INVALID_RE = re.compile(r"[^\w\s-]")
+SLUG_DASHES_RE = re.compile(r"-{2,}")
+
+# ASCII fast path for slugs: one bytes.translate lowercases A-Z and drops
+# everything but word chars / whitespace / hyphens (= SLUG_INVALID_RE)
+SLUG_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+SLUG_ASCII_DROP = bytes(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "_-")
+)
+
 
 async def parse_rss_feed(xml_content: str, source: dict, env=None) -> dict:
     """
@@ -41,9 +95,75 @@ async def parse_rss_feed(xml_content: str, source: dict, env=None) -> dict:
     Returns:
         {"articles": [...], "feed_title": str, "item_count": int}
     """
+    return _parse_feed(xml_content, source)
+
+
+async def parse_rss_feeds(feeds: list[dict], env=None) -> dict:
+    """
+    Parse several feeds in one Service Binding call.
+
+    Parsing is CPU-bound pure Python (and Pyodide has no threads), so
+    feeds are parsed one after another; the saving is one RPC round trip
+    for the whole batch instead of one per feed.
+
+    Args:
+        feeds: List of {"xml": str, "source": dict}
+        env: Cloudflare env bindings
+
+    Returns:
+        {"results": [<parse_rss_feed result>, ...]}  # same order as input
+        or {"results": [], "error": str} if more than MAX_BATCH_FEEDS are sent
+    """
+    if len(feeds) > MAX_BATCH_FEEDS:
+        return {
+            "results": [],
+            "error": f"Batch too large: {len(feeds)} feeds (max {MAX_BATCH_FEEDS})",
+        }
+    return {
+        "results": [
+            _parse_feed(feed.get("xml", ""), feed.get("source", {}))
+            for feed in feeds
+        ],
+    }
+
+
+def _parse_feed(xml_content: str, source: dict) -> dict:
+    """
+    Synchronous core of parse_rss_feed.
+
+    Unchanged feed bodies for the same source are served from _feed_cache
+    (LRU) instead of being parsed again. Callers get their own copies of
+    the result and article dicts, so the cached entry can't be mutated.
+    """
     if not xml_content or not xml_content.strip():
         return {"articles": [], "feed_title": "", "item_count": 0, "error": "Empty feed content"}
 
+    key = _feed_cache_key(xml_content, source)
+    result = _feed_cache.get(key)
+    if result is not None:
+        _feed_cache.move_to_end(key)
+    else:
+        result = _parse_xml(xml_content, source)
+        if "error" not in result:
+            _feed_cache[key] = result
+            if len(_feed_cache) > FEED_CACHE_SIZE:
+                _feed_cache.popitem(last=False)
+
+    return {**result, "articles": [dict(a) for a in result["articles"]]}
+
+
+def _feed_cache_key(xml_content: str | bytes, source: dict) -> bytes:
+    """Hash the feed body plus the source fields copied into each article."""
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8", "surrogatepass")
+    digest = hashlib.blake2b(xml_content, digest_size=16)
+    source_fields = (source.get("id"), source.get("name"), source.get("category"), source.get("country_id"))
+    digest.update(repr(source_fields).encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _parse_xml(xml_content: str, source: dict) -> dict:
+    """Parse feed XML into the parse_rss_feed result shape."""
     # feedparser handles RSS 2.0, Atom, RDF, CDF, and malformed feeds
     feed = feedparser.parse(xml_content)
 
@@ -56,11 +176,11 @@ async def parse_rss_feed(xml_content: str, source: dict, env=None) -> dict:
             "error": f"Feed parse error: {feed.bozo_exception}",
         }
 
-    articles = []
-    for entry in feed.entries[:20]:  # Limit to 20 most recent (matches TS)
-        article = _parse_entry(entry, source)
-        if article:
-            articles.append(article)
+    articles = [
+        article
+        for entry in islice(feed.entries, MAX_FEED_ITEMS)
+        if (article := _parse_entry(entry, source))
+    ]
 
     return {
         "articles": articles,
@@ -75,7 +195,7 @@ def _parse_entry(entry: dict, source: dict) -> dict | None:
 
     Matches the shape returned by SimpleRSSService.parseItem()
     """
-    title = entry.get("title", "").strip()
+    title = _clean_text(entry.get("title", ""))
     if not title:
         return None
 
@@ -86,8 +206,8 @@ def _parse_entry(entry: dict, source: dict) -> dict | None:
     if not link:
         return None
 
-    # Description — cleaned from HTML
-    description = _clean_summary(entry.get("summary", ""))
+    # Description — cleaned from HTML; the same parse yields the fallback image
+    description, summary_img = _parse_summary(entry.get("summary", ""))
 
     # Full content — prefer content:encoded (WordPress), fall back to summary
     content = ""
@@ -104,16 +224,16 @@ def _parse_entry(entry: dict, source: dict) -> dict | None:
     published = entry.get("published", "") or entry.get("updated", "")
 
     # Image extraction — feedparser understands media namespaces
-    image_url = _extract_image(entry)
+    image_url = _extract_image(entry, summary_img)
 
     # GUID for deduplication
     guid = entry.get("id", "") or link
 
-    # Slug from title
+    # Slug from the already-cleaned title
     slug = _generate_slug(title)
 
     return {
-        "title": _clean_text(title),
+        "title": title,
         "description": _clean_text(description[:500]) if description else None,
         "content": content,  # TODO: convert HTML→Markdown via content_cleaner
         "author": _clean_text(author) if author else None,
@@ -129,12 +249,13 @@ def _parse_entry(entry: dict, source: dict) -> dict | None:
     }
 
 
-def _extract_image(entry: dict) -> str | None:
+def _extract_image(entry: dict, summary_img: str | None | object = _UNPARSED) -> str | None:
     """
     Extract the best image URL from a feedparser entry.
 
     Replaces SimpleRSSService.extractImage() — 8 regex patterns reduced to
-    feedparser's built-in media support + one bs4 fallback.
+    feedparser's built-in media support + one HTML <img> fallback.
+    Pass `summary_img` (from _parse_summary) to avoid re-parsing the summary.
     """
     # 1. media:thumbnail (feedparser normalises to media_thumbnail)
     thumbnails = entry.get("media_thumbnail", [])
@@ -148,15 +269,15 @@ def _extract_image(entry: dict) -> str | None:
     if media and isinstance(media, list):
         for m in media:
             url = m.get("url", "")
-            mtype = m.get("type", "")
-            if "image" in mtype or _is_valid_image_url(url):
+            mtype = m.get("type", "").lower()
+            if mtype.startswith("image/") or _is_valid_image_url(url):
                 return url
 
     # 3. Enclosures (RSS 2.0 enclosure tag)
     enclosures = entry.get("enclosures", [])
     if enclosures and isinstance(enclosures, list):
         for enc in enclosures:
-            if "image" in enc.get("type", ""):
+            if enc.get("type", "").lower().startswith("image/"):
                 url = enc.get("href", "")
                 if _is_valid_image_url(url):
                     return url
@@ -168,23 +289,33 @@ def _extract_image(entry: dict) -> str | None:
         if _is_valid_image_url(url):
             return url
 
-    # 5. Fallback: extract from summary/content HTML with bs4
-    for html_field in [entry.get("summary", ""), _get_content_html(entry)]:
-        if not html_field:
-            continue
-        soup = BeautifulSoup(html_field, "html.parser")
-        img_tag = soup.find("img", src=True)
-        if img_tag:
-            url = img_tag["src"]
-            # Handle protocol-relative URLs
-            if url.startswith("//"):
-                url = f"https:{url}"
-            if _is_valid_image_url(url):
-                return url
+    # 5. Fallback: extract from summary/content HTML
+    if summary_img is _UNPARSED:
+        summary = entry.get("summary", "")
+        summary_img = _first_img_src(summary) if summary else None
+    if not isinstance(summary_img, str):
+        summary_img = None
+    url = _usable_img_src(summary_img)
+    if url:
+        return url
+
+    content_html = _get_content_html(entry)
+    if content_html:
+        return _usable_img_src(_first_img_src(content_html))
 
     return None
 
 
+def _usable_img_src(url: str | None) -> str | None:
+    """Normalise an <img> src and return it if it is a valid image URL."""
+    if not url:
+        return None
+    # Handle protocol-relative URLs
+    if url.startswith("//"):
+        url = f"https:{url}"
+    return url if _is_valid_image_url(url) else None
+
+
 def _get_content_html(entry: dict) -> str:
     """Get raw HTML content from feedparser entry."""
     if entry.get("content"):
@@ -192,25 +323,65 @@ def _get_content_html(entry: dict) -> str:
     return ""
 
 
+def _first_img_src(html: str) -> str | None:
+    """Return the src of the first <img> in an HTML fragment."""
+    if HAS_LXML:
+        try:
+            root = lxml_html.fragment_fromstring(html, create_parent=True, parser=HTML_PARSER)
+            srcs = IMG_SRC_XPATH(root)
+            return str(srcs[0]) if srcs else None
+        except (etree.LxmlError, ValueError):
+            pass  # Fall through to bs4
+    img_tag = BeautifulSoup(html, "html.parser").find("img", src=True)
+    return str(img_tag["src"]) if img_tag else None
+
+
 def _clean_summary(html: str) -> str:
     """
-    Clean HTML summary to plain text using bs4.
+    Clean HTML summary to plain text using lxml (bs4 fallback).
     Replaces 3-pass regex loop + manual entity map.
     """
+    return _parse_summary(html)[0]
+
+
+def _parse_summary(html: str) -> tuple[str, str | None]:
+    """
+    Parse summary HTML once, returning (plain text, first <img> src).
+    """
     if not html:
-        return ""
+        return "", None
+    if "<" not in html:
+        # Plain text (possibly with entities) — no tags, so no HTML parse
+        return " ".join(html_lib.unescape(html).split()), None
+    if HAS_LXML:
+        try:
+            root = lxml_html.fragment_fromstring(html, create_parent=True, parser=HTML_PARSER)
+            srcs = IMG_SRC_XPATH(root)
+            # Empty scripts, styles, iframes in place — their tails stay
+            # separate text runs instead of being spliced onto the text before
+            for el in list(root.iter("script", "style", "iframe")):
+                el.text = None
+                del el[:]
+            # Join text runs with spaces (like bs4's separator=" ") so adjacent
+            # block elements don't run together
+            text = " ".join(" ".join(root.itertext()).split())
+            return text, (str(srcs[0]) if srcs else None)
+        except (etree.LxmlError, ValueError):
+            pass  # Fall through to bs4
     soup = BeautifulSoup(html, "html.parser")
+    img_tag = soup.find("img", src=True)
+    img_src = str(img_tag["src"]) if img_tag else None
     # Remove scripts, styles, iframes
     for tag in soup(["script", "style", "iframe"]):
         tag.decompose()
-    return soup.get_text(separator=" ", strip=True)
+    return soup.get_text(separator=" ", strip=True), img_src
 
 
 def _clean_text(text: str) -> str:
-    """Normalise whitespace and trim."""
+    """Normalise whitespace and trim (str.split collapses runs in one C pass)."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def _generate_slug(title: str) -> str:
@@ -218,12 +389,15 @@ def _generate_slug(title: str) -> str:
     Generate URL-friendly slug from title.
     Matches SimpleRSSService.generateSlug()
     """
-    slug = title.lower()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s]+", "-", slug)
-    slug = re.sub(r"-{2,}", "-", slug)
-    slug = slug.strip("-")
-    return slug[:80]
+    if title.isascii():
+        slug = title.encode("ascii").translate(SLUG_ASCII_LOWER, SLUG_ASCII_DROP).decode("ascii")
+    else:
+        slug = SLUG_INVALID_RE.sub("", title.lower())
+    slug = "-".join(slug.split())
+    if "--" in slug:
+        slug = SLUG_DASHES_RE.sub("-", slug)
+    # Truncate before trimming the end so a cut on a hyphen can't leave one
+    return slug.lstrip("-")[:80].rstrip("-")
 
 
 def _is_valid_image_url(url: str) -> bool:
@@ -231,10 +405,30 @@ def _is_valid_image_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     url = url.strip()
-    if not url.startswith(("http://", "https://")):
+    if not url.lower().startswith(("http://", "https://")):
         return False
     # Filter ad domains
-    for domain in AD_DOMAINS:
-        if domain in url.lower():
-            return False
-    return True
+    return not _is_ad_url(url)
+
+
+@lru_cache(maxsize=4096)
+def _is_ad_url(url: str) -> bool:
+    """
+    Check the URL's host (and each parent domain) against AD_DOMAINS.
+    Cached — the same CDN and tracker URLs repeat across feeds in a batch.
+    """
+    try:
+        parts = urlsplit(url)
+        # Drop the root-label dot so "doubleclick.net." matches too
+        host = (parts.hostname or "").rstrip(".")
+    except ValueError:
+        return False
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        domain = ".".join(labels[i:])
+        if domain in AD_HOSTS:
+            return True
+        for ad_host, ad_path in AD_HOST_PATHS:
+            if domain == ad_host and parts.path.lower().startswith(ad_path):
+                return True
+    return False
@@ -10,8 +10,19 @@ AI insights, replacing:
 TS counterpart: AISearchService.ts (334 lines)
 """
 
+import logging
+import time
+
 from services.ai_client import AnthropicClient, get_embedding
 
+logger = logging.getLogger(__name__)
+
+# How long trending topics are served from memory before D1/Claude are asked again
+TRENDING_CACHE_TTL_SECONDS = 60
+
+# Last non-empty trending result: (monotonic timestamp, {"topics": [...]})
+_trending_cache: tuple[float, dict] | None = None
+
 
 async def semantic_search(query: str, options: dict = None, env=None) -> dict:
     """
@@ -67,13 +78,15 @@ async def semantic_search(query: str, options: dict = None, env=None) -> dict:
                 matches = vector_results.get("matches", [])
 
             if matches:
-                # Get article IDs and scores
-                article_ids = [m.id if hasattr(m, "id") else m.get("id") for m in matches]
+                # Scores keyed by bare article ID ("article_123" -> "123");
+                # the same keys are the IDs fetched, so every row returned
+                # has a score entry
                 score_map = {
-                    (m.id if hasattr(m, "id") else m.get("id")):
+                    str(m.id if hasattr(m, "id") else m.get("id")).removeprefix("article_"):
                     (m.score if hasattr(m, "score") else m.get("score", 0))
                     for m in matches
                 }
+                article_ids = list(score_map)
 
                 # Fetch full articles from D1 edge cache with filters
                 results = await _fetch_articles(
@@ -88,7 +101,7 @@ async def semantic_search(query: str, options: dict = None, env=None) -> dict:
                 return {"results": results, "insights": insights, "method": "semantic"}
 
         except Exception as e:
-            print(f"[SEARCH] Vector search failed, falling back to keyword: {e}")
+            logger.warning("[SEARCH] Vector search failed, falling back to keyword: %s", e)
 
     # ---------------------------------------------------------------
     # Fallback: keyword search via D1 LIKE queries
@@ -104,11 +117,27 @@ async def get_trending_topics(env=None) -> dict:
     Uses frequency analysis on keywords/titles instead of Llama AI.
     Falls back to Claude for summarisation if needed.
 
+    Results are kept in memory for TRENDING_CACHE_TTL_SECONDS, so repeated
+    calls on the same isolate skip the D1 query and the Claude round trip.
+
     TS counterpart: AISearchService.getTrendingTopics()
     """
+    global _trending_cache
+
     if not env:
         return {"topics": []}
 
+    if _trending_cache and time.monotonic() - _trending_cache[0] < TRENDING_CACHE_TTL_SECONDS:
+        return _trending_cache[1]
+
+    result = await _compute_trending_topics(env)
+    if result["topics"]:
+        _trending_cache = (time.monotonic(), result)
+    return result
+
+
+async def _compute_trending_topics(env) -> dict:
+    """Ask Claude for the top topics across the last 24h of headlines."""
     try:
         # Fetch recent article titles from D1 edge cache
         # TODO: migrate to MongoDB as primary source
@@ -143,7 +172,7 @@ Return: {{"topics": ["topic1", "topic2", "topic3", "topic4", "topic5"]}}"""
         return {"topics": topics[:5]}
 
     except Exception as e:
-        print(f"[SEARCH] Trending topics failed: {e}")
+        logger.error("[SEARCH] Trending topics failed: %s", e)
         return {"topics": []}
 
 
@@ -163,13 +192,13 @@ async def _fetch_articles(
         return []
 
     try:
-        placeholders = ",".join("?" for _ in article_ids)
+        params = [*article_ids]
+        placeholders = ",".join(["?"] * len(params))
         sql = f"""
             SELECT id, slug, title, description, source, category, published_at
             FROM articles
             WHERE id IN ({placeholders})
         """
-        params = list(article_ids)
 
         if category:
             sql += " AND category = ?"
@@ -188,23 +217,28 @@ async def _fetch_articles(
 
         result = await env.EDGE_CACHE_DB.prepare(sql).bind(*params).all()
         rows = result.results if hasattr(result, "results") else []
-
-        # Attach vector scores and sort by score descending
-        articles = []
-        for row in rows:
-            row_dict = dict(row) if not isinstance(row, dict) else row
-            article_id = row_dict.get("id")
-            row_dict["score"] = score_map.get(f"article_{article_id}", score_map.get(str(article_id), 0))
-            articles.append(row_dict)
-
-        articles.sort(key=lambda a: a.get("score", 0), reverse=True)
-        return articles[:limit]
+        return _attach_scores(rows, score_map, limit)
 
     except Exception as e:
-        print(f"[SEARCH] Edge cache query failed: {e}")
+        logger.error("[SEARCH] Edge cache query failed: %s", e)
         return []
 
 
+def _attach_scores(rows: list, score_map: dict, limit: int) -> list[dict]:
+    """
+    Attach vector scores to article rows and sort by score descending.
+    score_map is keyed by str(article_id) (see semantic_search).
+    """
+    articles = []
+    for row in rows:
+        row_dict = dict(row) if not isinstance(row, dict) else row
+        row_dict["score"] = score_map.get(str(row_dict.get("id")), 0)
+        articles.append(row_dict)
+
+    articles.sort(key=lambda a: a.get("score", 0), reverse=True)
+    return articles[:limit]
+
+
 async def _keyword_search(
     query: str,
     category: str | None,
@@ -248,7 +282,7 @@ async def _keyword_search(
         ]
 
     except Exception as e:
-        print(f"[SEARCH] Keyword search failed: {e}")
+        logger.error("[SEARCH] Keyword search failed: %s", e)
         return []
 
 
@@ -271,5 +305,5 @@ Return JSON: {{"type": "summary", "content": "brief insight text", "confidence":
         return []
 
     except Exception as e:
-        print(f"[SEARCH] Insight generation failed: {e}")
+        logger.error("[SEARCH] Insight generation failed: %s", e)
         return []
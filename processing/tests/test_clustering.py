@@ -11,6 +11,7 @@ from services.clustering import (
     _normalise_title,
     _jaccard_similarity,
     _jaccard_cluster,
+    _jaccard_matrix,
     STOP_WORDS,
 )
 
@@ -76,6 +77,22 @@ class TestJaccardSimilarity:
         assert _jaccard_similarity([], []) == 0.0
 
 
+class TestJaccardMatrix:
+    def test_matches_pairwise_similarity(self):
+        titles = [
+            ["zimbabwe", "economy", "grows"],
+            ["zimbabwe", "economy", "shrinks"],
+            ["harare", "floods"],
+            [],
+            ["zimbabwe", "zimbabwe", "floods"],
+        ]
+        sim = _jaccard_matrix(titles)
+        for i in range(len(titles)):
+            for j in range(len(titles)):
+                if i != j:
+                    assert sim[i].get(j, 0.0) == pytest.approx(_jaccard_similarity(titles[i], titles[j]))
+
+
 class TestClusterArticles:
     @pytest.mark.asyncio
     async def test_clusters_similar_titles(self):
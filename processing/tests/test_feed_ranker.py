@@ -5,7 +5,10 @@ Covers: scoring weights, recency decay, engagement formula,
 diversity penalty, preference matching, numpy/fallback parity.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+import services.feed_ranker as feed_ranker
 from services.feed_ranker import rank_feed, _recency_score, _engagement_score
 
 
@@ -53,6 +56,30 @@ class TestRankFeed:
         assert "recency" in article["score_breakdown"]
         assert "engagement" in article["score_breakdown"]
 
+    @pytest.mark.asyncio
+    async def test_numpy_matches_loop_scoring(self, monkeypatch):
+        twelve_hours_ago = (datetime.now(timezone.utc) - timedelta(hours=12)).isoformat()
+        articles = [
+            {"id": 1, "category_id": "news", "published_at": "2020-01-01T00:00:00Z", "view_count": 100, "like_count": 10, "bookmark_count": 5},
+            {"id": 2, "category_id": "sport", "published_at": "invalid", "view_count": None, "like_count": 3},
+            {"id": 3, "category_id": "news", "published_at": ""},
+            {"id": 4, "category_id": "business", "published_at": twelve_hours_ago, "view_count": 40, "bookmark_count": 2},
+        ]
+        vectorised = await rank_feed(articles, {})
+        monkeypatch.setattr(feed_ranker, "HAS_NUMPY", False)
+        looped = await rank_feed(articles, {})
+
+        def breakdowns(result):
+            return {a["id"]: (a["score_breakdown"]["recency"], a["score_breakdown"]["engagement"]) for a in result["articles"]}
+        vec, loop = breakdowns(vectorised), breakdowns(looped)
+        for article_id, (recency, engagement) in loop.items():
+            assert vec[article_id] == (pytest.approx(recency, abs=0.01), pytest.approx(engagement, abs=0.01))
+
+        # 12h with a 24h half-life decays to ~0.707 — a real, nonzero value
+        expected = _recency_score(twelve_hours_ago) * feed_ranker.WEIGHTS["recency"]
+        assert vec[4][0] == pytest.approx(expected, abs=0.01)
+        assert vec[4][0] == pytest.approx(0.5 ** 0.5 * feed_ranker.WEIGHTS["recency"], abs=0.05)
+
 
 class TestRecencyScore:
     def test_recent_article_scores_high(self):
@@ -0,0 +1,158 @@
+"""
+Tests for keyword extractor service.
+
+Covers: prompt truncation, edge cache keyword loading (caching and
+single-flight dedup), text-matching fallback.
+"""
+
+import asyncio
+
+import pytest
+import services.keyword_extractor as keyword_extractor
+from services.keyword_extractor import (
+    extract_keywords,
+    extract_keywords_batch,
+    _load_keywords,
+    MAX_BATCH_ARTICLES,
+    _truncate_on_word,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fake D1 binding
+# ---------------------------------------------------------------------------
+
+KEYWORDS = [
+    {"keyword": "Harare", "category_id": "local", "relevance_score": 0.9},
+    {"keyword": "Economy", "category_id": "business", "relevance_score": 0.8},
+]
+
+
+class _Result:
+    def __init__(self, rows):
+        self.results = rows
+
+
+class _Statement:
+    def __init__(self, db):
+        self.db = db
+
+    async def all(self):
+        self.db.calls += 1
+        await asyncio.sleep(0)
+        return _Result(self.db.rows)
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def prepare(self, sql):
+        return _Statement(self)
+
+
+class _FakeEnv:
+    ANTHROPIC_API_KEY = "test-key"
+
+    def __init__(self, rows=KEYWORDS):
+        self.EDGE_CACHE_DB = _FakeDB(rows)
+
+
+@pytest.fixture(autouse=True)
+def _reset_keyword_cache():
+    keyword_extractor._keyword_cache = None
+    keyword_extractor._keyword_inflight = None
+    yield
+    keyword_extractor._keyword_cache = None
+    keyword_extractor._keyword_inflight = None
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestTruncateOnWord:
+    def test_short_text_unchanged(self):
+        assert _truncate_on_word("Hello world", 1500) == "Hello world"
+
+    def test_cuts_on_word_boundary(self):
+        text = "word " * 400
+        result = _truncate_on_word(text, 1500)
+        assert len(result) <= 1500
+        assert result.endswith("word")
+
+    def test_hard_cut_without_spaces(self):
+        assert len(_truncate_on_word("x" * 2000, 1500)) == 1500
+
+
+class TestLoadKeywords:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_query(self):
+        env = _FakeEnv()
+        results = await asyncio.gather(*[_load_keywords(env) for _ in range(5)])
+        assert env.EDGE_CACHE_DB.calls == 1
+        assert all(r == KEYWORDS for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self):
+        env = _FakeEnv()
+        await _load_keywords(env)
+        await _load_keywords(env)
+        assert env.EDGE_CACHE_DB.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_result_not_cached(self):
+        env = _FakeEnv(rows=[])
+        await _load_keywords(env)
+        await _load_keywords(env)
+        assert env.EDGE_CACHE_DB.calls == 2
+
+
+class TestExtractKeywords:
+    @pytest.mark.asyncio
+    async def test_short_content_returns_empty(self):
+        result = await extract_keywords("Title", "Too short", env=_FakeEnv())
+        assert result == {"keywords": []}
+
+    @pytest.mark.asyncio
+    async def test_text_matching_fallback(self):
+        # No AI binding on the fake env, so Claude fails and the fallback runs
+        content = "Business leaders met in Harare on Monday to discuss the national budget."
+        result = await extract_keywords("Budget talks", content, env=_FakeEnv())
+        keywords = [k["keyword"] for k in result["keywords"]]
+        assert keywords == ["Harare"]
+
+
+class TestExtractKeywordsBatch:
+    @pytest.mark.asyncio
+    async def test_loads_keywords_once_and_keeps_order(self):
+        env = _FakeEnv()
+        articles = [
+            {"title": "A", "content": "Traffic in Harare was heavy this morning after the storm passed through."},
+            {"title": "B", "content": "short"},
+            {"title": "C", "content": "The economy is expected to recover as exports rise in the coming quarter."},
+        ]
+        result = await extract_keywords_batch(articles, env=env)
+        assert env.EDGE_CACHE_DB.calls == 1
+        assert [[k["keyword"] for k in r["keywords"]] for r in result["results"]] == [["Harare"], [], ["Economy"]]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        assert await extract_keywords_batch([], env=_FakeEnv()) == {"results": []}
+
+    @pytest.mark.asyncio
+    async def test_oversize_batch_rejected(self):
+        env = _FakeEnv()
+        articles = [{"title": "A", "content": "short"}] * (MAX_BATCH_ARTICLES + 1)
+        result = await extract_keywords_batch(articles, env=env)
+        assert result["results"] == []
+        assert "max 50" in result["error"]
+        assert env.EDGE_CACHE_DB.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_accepted(self):
+        articles = [{"title": "A", "content": "short"}] * MAX_BATCH_ARTICLES
+        result = await extract_keywords_batch(articles, env=_FakeEnv())
+        assert len(result["results"]) == MAX_BATCH_ARTICLES
+        assert "error" not in result
@@ -6,7 +6,19 @@ malformed feeds, empty feeds, Atom format, media namespaces.
 """
 
 import pytest
-from services.rss_parser import parse_rss_feed, _parse_entry, _extract_image, _clean_summary, _generate_slug
+import services.rss_parser as rss_parser
+from services.rss_parser import (
+    parse_rss_feed,
+    parse_rss_feeds,
+    _parse_entry,
+    _extract_image,
+    _clean_summary,
+    _parse_summary,
+    _clean_text,
+    _generate_slug,
+    _is_valid_image_url,
+    MAX_BATCH_FEEDS,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -104,6 +116,46 @@ class TestParseRSSFeed:
         result = await parse_rss_feed(xml, SOURCE)
         assert len(result["articles"]) <= 20
 
+    @pytest.mark.asyncio
+    async def test_repeat_parse_returns_independent_copies(self):
+        first = await parse_rss_feed(RSS_SAMPLE, SOURCE)
+        first["articles"][0]["title"] = "Mutated"
+        first["articles"].clear()
+        second = await parse_rss_feed(RSS_SAMPLE, SOURCE)
+        assert second["articles"][0]["title"] == "Zimbabwe economy grows 5%"
+
+    @pytest.mark.asyncio
+    async def test_same_feed_different_source(self):
+        other = {**SOURCE, "id": 2, "name": "Other Source"}
+        await parse_rss_feed(RSS_SAMPLE, SOURCE)
+        result = await parse_rss_feed(RSS_SAMPLE, other)
+        assert result["articles"][0]["source_id"] == 2
+        assert result["articles"][0]["source"] == "Other Source"
+
+
+class TestParseRSSFeeds:
+    @pytest.mark.asyncio
+    async def test_parses_each_feed_in_order(self):
+        result = await parse_rss_feeds([
+            {"xml": RSS_SAMPLE, "source": SOURCE},
+            {"xml": "", "source": SOURCE},
+            {"xml": ATOM_SAMPLE, "source": SOURCE},
+        ])
+        feeds = result["results"]
+        assert [f["feed_title"] for f in feeds] == ["Test News", "", "Atom Feed"]
+        assert "error" in feeds[1]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        assert await parse_rss_feeds([]) == {"results": []}
+
+    @pytest.mark.asyncio
+    async def test_oversize_batch_rejected(self):
+        feeds = [{"xml": RSS_SAMPLE, "source": SOURCE}] * (MAX_BATCH_FEEDS + 1)
+        result = await parse_rss_feeds(feeds)
+        assert result["results"] == []
+        assert "max 50" in result["error"]
+
 
 class TestCleanSummary:
     def test_removes_html_tags(self):
@@ -121,6 +173,68 @@ class TestCleanSummary:
         assert "&" in result
         assert "<" in result
 
+    def test_removed_tag_tail_kept_as_separate_run(self):
+        html = "<div>a</div>tail<script>s</script>after"
+        assert _clean_summary(html) == "a tail after"
+
+    @pytest.mark.parametrize("html", [
+        "<div>a</div>tail<script>s</script>after",
+        "<p>Hello <b>world</b></p><style>p {}</style><p>Again</p>",
+        '<p>Rains <iframe src="x"><p>hidden</p></iframe>hit <img src="https://cdn.example.com/a.jpg">Harare</p>',
+        "<p>Fish &amp; chips</p>",
+    ])
+    def test_lxml_and_bs4_paths_agree(self, monkeypatch, html):
+        if not rss_parser.HAS_LXML:
+            pytest.skip("lxml not installed")
+        via_lxml = _parse_summary(html)
+        monkeypatch.setattr(rss_parser, "HAS_LXML", False)
+        assert via_lxml == _parse_summary(html)
+
+    def test_plain_text_skips_parser(self):
+        assert _parse_summary("  Rains &amp; floods\n hit   Harare ") == ("Rains & floods hit Harare", None)
+
+    def test_parse_summary_returns_text_and_first_image(self):
+        html = '<p>Rains hit <img src="https://cdn.example.com/a.jpg">Harare</p><img src="b.jpg">'
+        assert _parse_summary(html) == ("Rains hit Harare", "https://cdn.example.com/a.jpg")
+
+    def test_parse_summary_without_image(self):
+        assert _parse_summary("<p>No image</p>") == ("No image", None)
+
+
+class TestCleanText:
+    def test_collapses_whitespace_runs(self):
+        assert _clean_text("  Breaking:\n\tRains \r\n hit Harare  ") == "Breaking: Rains hit Harare"
+
+    def test_empty(self):
+        assert _clean_text("") == ""
+
+
+class TestIsValidImageUrl:
+    def test_accepts_http_image(self):
+        assert _is_valid_image_url("https://cdn.example.com/photo.jpg")
+
+    def test_rejects_non_http(self):
+        assert not _is_valid_image_url("data:image/png;base64,AAAA")
+        assert not _is_valid_image_url("")
+
+    def test_rejects_ad_domains(self):
+        assert not _is_valid_image_url("https://ad.doubleclick.net/pixel.gif")
+        assert not _is_valid_image_url("https://www.facebook.com/tr?id=1")
+
+    def test_rejects_fully_qualified_ad_host(self):
+        assert not _is_valid_image_url("https://doubleclick.net./x.gif")
+        assert not _is_valid_image_url("https://ad.doubleclick.net./x.gif")
+
+    def test_ad_check_is_case_insensitive(self):
+        assert not _is_valid_image_url("https://AD.DoubleClick.NET/pixel.gif")
+
+    def test_ad_domain_in_path_is_not_ad(self):
+        assert _is_valid_image_url("https://cdn.example.com/doubleclick.net/photo.jpg")
+        assert _is_valid_image_url("https://notdoubleclick.net/photo.jpg")
+
+    def test_ad_path_only_matches_on_its_host(self):
+        assert _is_valid_image_url("https://www.facebook.com/images/photo.jpg")
+
 
 class TestGenerateSlug:
     def test_basic_slug(self):
@@ -133,5 +247,18 @@ class TestGenerateSlug:
         long_title = "A " * 50
         assert len(_generate_slug(long_title)) <= 80
 
+    def test_whitespace_runs_become_single_hyphen(self):
+        assert _generate_slug("Rains \t hit  -  Harare") == "rains-hit-harare"
+
+    def test_ascii_punctuation_dropped(self):
+        assert _generate_slug("Mnangagwa: 'Snake_case' & co. -- WIN!") == "mnangagwa-snake_case-co-win"
+
+    def test_non_ascii_letters_kept(self):
+        assert _generate_slug("Élections: Ça Va?") == "élections-ça-va"
+
+    def test_truncation_does_not_end_on_hyphen(self):
+        slug = _generate_slug("a" * 79 + " b")
+        assert slug == "a" * 79
+
     def test_strips_trailing_hyphens(self):
         assert not _generate_slug("Test - ").endswith("-")
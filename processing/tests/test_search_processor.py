@@ -0,0 +1,159 @@
+"""
+Tests for search processor service.
+
+Covers: D1 article fetch with filters, score attachment and ordering,
+trending topics in-process cache.
+"""
+
+import pytest
+import services.search_processor as search_processor
+from services.search_processor import (
+    semantic_search,
+    _fetch_articles,
+    _attach_scores,
+    get_trending_topics,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fake D1 binding
+# ---------------------------------------------------------------------------
+
+class _Result:
+    def __init__(self, rows):
+        self.results = rows
+
+
+class _Statement:
+    def __init__(self, db, sql):
+        self.db = db
+        self.sql = sql
+
+    def bind(self, *params):
+        self.db.queries.append((self.sql, params))
+        return self
+
+    async def all(self):
+        return _Result(self.db.rows)
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def prepare(self, sql):
+        return _Statement(self, sql)
+
+
+class _FakeVectorize:
+    def __init__(self, matches):
+        self.matches = matches
+
+    async def query(self, embedding, options):
+        return {"matches": self.matches}
+
+
+class _Env:
+    def __init__(self, rows=(), matches=()):
+        self.EDGE_CACHE_DB = _FakeDB(list(rows))
+        self.VECTORIZE_INDEX = _FakeVectorize(list(matches))
+
+
+class TestFetchArticles:
+    @pytest.mark.asyncio
+    async def test_binds_ids_and_filters(self):
+        env = _Env([{"id": 1, "title": "A"}])
+        await _fetch_articles(["1", "2"], {"1": 0.9}, "news", None, "2026-01-01", None, 10, env)
+        sql, params = env.EDGE_CACHE_DB.queries[0]
+        assert "id IN (?,?)" in sql
+        assert "category = ?" in sql and "published_at >= ?" in sql
+        assert params == ("1", "2", "news", "2026-01-01")
+
+    @pytest.mark.asyncio
+    async def test_attaches_scores(self):
+        env = _Env([{"id": 1, "title": "A"}, {"id": 2, "title": "B"}])
+        result = await _fetch_articles(["1", "2"], {"1": 0.2, "2": 0.9}, None, None, None, None, 10, env)
+        assert [(r["id"], r["score"]) for r in result] == [(2, 0.9), (1, 0.2)]
+
+    @pytest.mark.asyncio
+    async def test_no_ids(self):
+        env = _Env()
+        assert await _fetch_articles([], {}, None, None, None, None, 10, env) == []
+        assert env.EDGE_CACHE_DB.queries == []
+
+    @pytest.mark.asyncio
+    async def test_query_failure_returns_empty(self):
+        class _Broken:
+            EDGE_CACHE_DB = None
+        assert await _fetch_articles(["1"], {}, None, None, None, None, 10, _Broken()) == []
+
+
+class TestSemanticSearch:
+    @pytest.mark.asyncio
+    async def test_fetches_bare_ids_matching_score_keys(self, monkeypatch):
+        async def fake_embedding(text, env):
+            return [0.1, 0.2]
+        monkeypatch.setattr(search_processor, "get_embedding", fake_embedding)
+        env = _Env(
+            rows=[{"id": 123, "title": "A"}, {"id": 7, "title": "B"}],
+            matches=[{"id": "article_123", "score": 0.9}, {"id": "article_7", "score": 0.4}],
+        )
+        result = await semantic_search("harare floods", env=env)
+        _, params = env.EDGE_CACHE_DB.queries[0]
+        assert params == ("123", "7")
+        assert result["method"] == "semantic"
+        assert [(r["id"], r["score"]) for r in result["results"]] == [(123, 0.9), (7, 0.4)]
+
+
+class TestAttachScores:
+    def test_sorts_by_score(self):
+        rows = [{"id": 1}, {"id": 2}]
+        result = _attach_scores(rows, {"1": 0.2, "2": 0.8}, 10)
+        assert [r["id"] for r in result] == [2, 1]
+
+    def test_missing_score_defaults_to_zero(self):
+        result = _attach_scores([{"id": 3}], {}, 10)
+        assert result[0]["score"] == 0
+
+    def test_respects_limit(self):
+        rows = [{"id": i} for i in range(5)]
+        assert len(_attach_scores(rows, {}, 2)) == 2
+
+
+@pytest.fixture
+def _reset_trending_cache():
+    search_processor._trending_cache = None
+    yield
+    search_processor._trending_cache = None
+
+
+def _fake_trending(result, calls):
+    async def compute(env):
+        calls.append(env)
+        return result
+    return compute
+
+
+@pytest.mark.usefixtures("_reset_trending_cache")
+class TestGetTrendingTopics:
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(search_processor, "_compute_trending_topics", _fake_trending({"topics": ["Elections"]}, calls))
+        env = _Env()
+        assert await get_trending_topics(env) == {"topics": ["Elections"]}
+        assert await get_trending_topics(env) == {"topics": ["Elections"]}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_result_not_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(search_processor, "_compute_trending_topics", _fake_trending({"topics": []}, calls))
+        await get_trending_topics(_Env())
+        await get_trending_topics(_Env())
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_env(self):
+        assert await get_trending_topics(None) == {"topics": []}